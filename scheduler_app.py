@@ -84,14 +84,89 @@ def main():
                     date = datetime.strptime(date_str, '%Y-%m-%d')
                     app.display_schedule(date)
                 except ValueError:# Import necessary libraries for the scheduling application
+import bisect                        # For keeping appointments sorted by start time
+import functools                     # For caching formatted date headers
+import itertools                     # For stopping conflict searches early
 import json                          # For saving/loading appointment data to/from files
+import operator                      # For fast sort keys
 import os                           # For checking if files exist
-from datetime import datetime, timedelta  # For handling dates and times
+import re                           # For matching non-ISO date/time input
+import sqlite3                      # For the optional SQLite storage backend
+import sys                          # For writing schedule output in one go
+import uuid                         # For generating unique appointment IDs
+from datetime import date, datetime, time, timedelta  # For handling dates and times
 from typing import List, Dict, Optional   # For type hints to make code more readable
 
+try:
+    import orjson                    # Optional: much faster JSON encoding/decoding
+except ImportError:
+    orjson = None                    # Fall back to the standard library json module
+
+try:
+    import ijson                     # Optional: streaming parser for very large schedule files
+except ImportError:
+    ijson = None
+
+# Errors that mean the schedule file is corrupted rather than unreadable: bad JSON
+# or bad UTF-8 (ValueError), or valid JSON that isn't a list of appointment objects
+_LOAD_ERRORS = (ValueError, KeyError, TypeError, AttributeError) + ((ijson.JSONError,) if ijson else ())
+
+# Bound once at import time; from_dict runs for every stored appointment on load
+_fromiso = datetime.fromisoformat
+
+# Appointment times are naive local times, so they're compared and stored as whole
+# seconds since this naive epoch (no timezone or DST conversion involved)
+_EPOCH = datetime(1970, 1, 1)
+_SECOND = timedelta(seconds=1)
+_DAY_SECONDS = 24 * 60 * 60
+
+
+def _to_ts(dt: datetime) -> int:
+    """Convert a naive datetime to integer seconds since _EPOCH"""
+    return (dt - _EPOCH) // _SECOND
+
+
+def _from_ts(ts: int) -> datetime:
+    """Convert integer seconds since _EPOCH back to a naive datetime"""
+    return _EPOCH + timedelta(0, ts)
+
+
+def _json_dumps(data, indent: bool = True) -> bytes:
+    """
+    Encode data as JSON bytes, using orjson when it's installed
+    With indent=False the output is compact and fits on a single line
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(raw: bytes):
+    """Decode JSON bytes, using orjson when it's installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@functools.lru_cache(maxsize=128)
+def _format_day(day) -> str:
+    """Format a date as a schedule header, e.g. "2025-09-20 (Saturday)" (cached per date)"""
+    return day.strftime('%Y-%m-%d (%A)')
+
+
+# Sort key for ordering appointments chronologically
+_by_start = operator.attrgetter('start_ts')
+
+
 # ==================== APPOINTMENT CLASS ====================
 # This class represents a single appointment/event in the schedule
 class Appointment:
+    # Fixed attribute set: no per-instance __dict__, smaller objects and faster attribute access
+    __slots__ = ('id', 'title', 'start_time', 'end_time', 'start_ts', 'end_ts',
+                 'description', 'location', '_start_date', '_str_cache')
+    
     def __init__(self, title: str, start_time: datetime, end_time: datetime, 
                  description: str = "", location: str = ""):
         """
@@ -107,28 +182,34 @@ class Appointment:
         self.title = title                      # Store appointment title
         self.start_time = start_time           # Store start date/time
         self.end_time = end_time               # Store end date/time
+        self.start_ts = _to_ts(start_time)     # Start/end as integer seconds, for fast comparisons
+        self.end_ts = _to_ts(end_time)
         self.description = description         # Store optional description
         self.location = location               # Store optional location
+        self._start_date = start_time.date()   # Day the appointment falls on, used for grouping
+        self._str_cache = None                 # Formatted __str__ output, built on first use
         
     def _generate_id(self) -> str:
         """
-        Generate a unique ID based on current timestamp
-        This creates a unique identifier for each appointment by using
-        the current time in microseconds, ensuring no duplicates
+        Generate a unique ID for a new appointment
+        Uses a random UUID, so appointments created in quick succession can't
+        collide, and the first 8 characters shown to the user are as distinct
+        as the rest (a timestamp's leading digits are the same for hours)
         """
-        return str(int(datetime.now().timestamp() * 1000000))
+        return uuid.uuid4().hex
     
     def to_dict(self) -> Dict:
         """
         Convert appointment to dictionary format for JSON storage
         This allows us to save appointments to a file by converting
         all the appointment data into a format that can be stored
+        Times are stored as integer seconds, so loading needs no date parsing
         """
         return {
             'id': self.id,
             'title': self.title,
-            'start_time': self.start_time.isoformat(),  # Convert datetime to string
-            'end_time': self.end_time.isoformat(),      # Convert datetime to string
+            'start_ts': self.start_ts,
+            'end_ts': self.end_ts,
             'description': self.description,
             'location': self.location
         }
@@ -138,20 +219,59 @@ class Appointment:
         """
         Create appointment object from dictionary data (opposite of to_dict)
         This is used when loading appointments from a saved file
+        Also accepts older files that stored ISO 'start_time'/'end_time' strings
         Args:
             data: Dictionary containing appointment information
         Returns:
             Appointment object created from the dictionary data
         """
-        # Create a new appointment with the loaded data
-        appointment = cls(
-            title=data['title'],
-            start_time=datetime.fromisoformat(data['start_time']),  # Convert string back to datetime
-            end_time=datetime.fromisoformat(data['end_time']),      # Convert string back to datetime
-            description=data.get('description', ''),                # Use empty string if not found
-            location=data.get('location', '')                       # Use empty string if not found
-        )
-        appointment.id = data['id']  # Restore the original ID
+        # Bypass __init__ so we don't generate an ID that is overwritten anyway
+        appointment = cls.__new__(cls)
+        get = data.get
+        appointment.id = data['id']                                   # Restore the original ID
+        appointment.title = data['title']
+        start_ts = get('start_ts')
+        if start_ts is not None:
+            appointment.start_ts = start_ts
+            appointment.end_ts = data['end_ts']
+            appointment.start_time = _from_ts(start_ts)
+            appointment.end_time = _from_ts(appointment.end_ts)
+        else:
+            # Older format: ISO strings
+            appointment.start_time = _fromiso(data['start_time'])    # Convert string back to datetime
+            appointment.end_time = _fromiso(data['end_time'])        # Convert string back to datetime
+            appointment.start_ts = _to_ts(appointment.start_time)
+            appointment.end_ts = _to_ts(appointment.end_time)
+        appointment.description = get('description', '')            # Use empty string if not found
+        appointment.location = get('location', '')                   # Use empty string if not found
+        appointment._start_date = appointment.start_time.date()
+        appointment._str_cache = None
+        return appointment
+    
+    def to_row(self) -> tuple:
+        """
+        Convert appointment to a row for the SQLite table
+        Column order matches SchedulingApp's appt table
+        """
+        return (self.id, self.title, self.start_ts, self.end_ts,
+                self.description, self.location)
+    
+    @classmethod
+    def from_row(cls, row):
+        """
+        Create appointment object from a SQLite row (opposite of to_row)
+        Args:
+            row: (id, title, start_ts, end_ts, description, location)
+        Returns:
+            Appointment object created from the row
+        """
+        appointment = cls.__new__(cls)
+        (appointment.id, appointment.title, appointment.start_ts, appointment.end_ts,
+         appointment.description, appointment.location) = row
+        appointment.start_time = _from_ts(appointment.start_ts)
+        appointment.end_time = _from_ts(appointment.end_ts)
+        appointment._start_date = appointment.start_time.date()
+        appointment._str_cache = None
         return appointment
     
     def overlaps_with(self, other) -> bool:
@@ -168,20 +288,24 @@ class Appointment:
         Returns:
             True if appointments overlap, False otherwise
         """
-        return (self.start_time < other.end_time and 
-                self.end_time > other.start_time)
+        return (self.start_ts < other.end_ts and 
+                self.end_ts > other.start_ts)
     
     def __str__(self) -> str:
         """
         Create a readable string representation of the appointment
         This is what gets displayed when we print or show the appointment
         Format: "Title | YYYY-MM-DD HH:MM - HH:MM | Location"
+        The result is cached, since appointments aren't modified after creation
         """
+        if self._str_cache is not None:
+            return self._str_cache
         start_str = self.start_time.strftime("%Y-%m-%d %H:%M")  # Format start time
         end_str = self.end_time.strftime("%H:%M")               # Format end time (same day)
         result = f"{self.title} | {start_str} - {end_str}"      # Basic format
         if self.location:                                       # Add location if it exists
             result += f" | {self.location}"
+        self._str_cache = result
         return result
 
 # ==================== MAIN SCHEDULING APP CLASS ====================
@@ -195,7 +319,30 @@ class SchedulingApp:
     - Saving/loading data to/from files
     - Checking for conflicts
     - Displaying schedules
+    
+    Storage is a JSON snapshot (data_file) plus an append-only change log
+    next to it. Each add/remove appends one line to the log instead of
+    rewriting the whole snapshot; the log is folded back into the snapshot
+    once it grows large enough.
+    
+    Nothing is read from disk until the appointments are first needed, so
+    commands that never touch the schedule don't pay for loading it.
+    
+    If data_file has a SQLite extension (e.g. schedule.db), appointments are
+    stored in a SQLite table instead and each add/remove is a single
+    INSERT/DELETE.
     """
+    SQLITE_EXTENSIONS = ('.db', '.sqlite', '.sqlite3')
+    
+    # The log is compacted once it is bigger than this many times the snapshot...
+    LOG_COMPACT_RATIO = 2
+    # ...but never before it reaches this size, so small schedules don't rewrite constantly
+    LOG_COMPACT_MIN_BYTES = 64 * 1024
+    # Snapshots at least this big are parsed incrementally with ijson (if installed)
+    STREAM_LOAD_MIN_BYTES = 8 * 1024 * 1024
+    # At most this many conflicts are listed when adding an appointment
+    MAX_CONFLICTS_SHOWN = 10
+    
     def __init__(self, data_file: str = "schedule.json"):
         """
         Initialize the scheduling application
@@ -203,36 +350,294 @@ class SchedulingApp:
             data_file: Name of file to save appointments to (default: schedule.json)
         """
         self.data_file = data_file                    # File where appointments are saved
-        self.appointments: List[Appointment] = []     # List to store all appointments in memory
-        self.load_appointments()                      # Load any existing appointments from file
+        # Change log lives next to the snapshot, e.g. schedule.log.ndjson
+        self.log_file = os.path.splitext(data_file)[0] + ".log.ndjson"
+        self._appointments: List[Appointment] = []    # All appointments, kept sorted by start time
+        self._loaded = False                          # Whether storage has been read yet
+        self._load_failed = False                     # Stored data was unreadable; don't overwrite it
+        self._starts: List[int] = []                  # Start timestamps, parallel to self._appointments
+        self._by_id: Dict[str, Appointment] = {}      # Same appointments, keyed by ID
+        self._max_duration = 0                        # Longest appointment seen (seconds), bounds conflict search
+        self._snapshot_size = 0                       # Bytes in the snapshot file
+        self._log_size = 0                            # Bytes in the change log
+        # SQLite storage is picked by file extension; the connection opens on first use
+        self._use_db = os.path.splitext(data_file)[1].lower() in self.SQLITE_EXTENSIONS
+        self._db: Optional[sqlite3.Connection] = None
+        # Snapshot and log files stay open for the whole session once first written
+        self._data_fd = None
+        self._log_fd = None
+        # Existing appointments are loaded on first use, see _ensure_loaded
+    
+    @property
+    def appointments(self) -> List[Appointment]:
+        """All appointments, sorted by start time (loads them on first access)"""
+        self._ensure_loaded()
+        return self._appointments
+    
+    def _ensure_loaded(self):
+        """Load appointments from storage if that hasn't happened yet"""
+        if not self._loaded:
+            self.load_appointments()
     
     def load_appointments(self):
         """
         Load saved appointments from the JSON file into memory
         This runs when the app starts to restore previous appointments
-        Handles file not existing or corrupted data gracefully
+        Reads the snapshot first, then replays the change log on top of it
+        Handles file not existing or corrupted data gracefully; a corrupted
+        snapshot is left untouched on disk (see save_appointments)
+        Any other error propagates and leaves the app unloaded, so nothing
+        is written until a later load succeeds
         """
+        self._log_size = 0
+        if self._use_db:
+            try:
+                rows = self._connection().execute(
+                    "SELECT id, title, start_ts, end_ts, description, location FROM appt")
+                self._appointments = [Appointment.from_row(row) for row in rows]
+            except sqlite3.DatabaseError as e:       # Not a database, or a damaged one
+                print(f"Error loading appointments: {e}")
+                self._appointments = []
+                self._load_failed = True
+            self._reindex()
+            self._loaded = True
+            return
+        
         if os.path.exists(self.data_file):           # Check if save file exists
             try:
-                with open(self.data_file, 'r') as f: # Open file for reading
-                    data = json.load(f)              # Parse JSON data from file
+                size = os.path.getsize(self.data_file)
+                with open(self.data_file, 'rb') as f: # Open file for reading
+                    if ijson is not None and size >= self.STREAM_LOAD_MIN_BYTES:
+                        # Large file: parse one appointment at a time instead of
+                        # holding every parsed dictionary in memory at once
+                        data = ijson.items(f, 'item')
+                    else:
+                        data = _json_loads(f.read())  # Parse JSON data from file
                     # Convert each dictionary back into an Appointment object
-                    self.appointments = [Appointment.from_dict(apt) for apt in data]
-            except (json.JSONDecodeError, KeyError) as e:  # Handle corrupted files
+                    self._appointments = [Appointment.from_dict(apt) for apt in data]
+                self._snapshot_size = size
+            except _LOAD_ERRORS as e:                # Handle corrupted files
                 print(f"Error loading appointments: {e}")
-                self.appointments = []               # Start with empty list if file is corrupted
+                self._appointments = []              # Start with empty list if file is corrupted
+                self._load_failed = True             # ...but keep the file for the user to recover
+        
+        # Older timestamp-based IDs could collide; make them unique before
+        # anything is looked up by ID
+        renamed = self._dedupe_ids()
+        
+        if os.path.exists(self.log_file):
+            self._replay_log()
+        self._reindex()
+        self._loaded = True
+        if renamed:
+            self.save_appointments()                 # Persist the new IDs
+        elif self._log_size:
+            self._maybe_compact()
+    
+    def _dedupe_ids(self) -> bool:
+        """
+        Give a fresh ID to any appointment whose ID is already taken
+        Keeps every appointment reachable by ID instead of one hiding another
+        Returns:
+            True if any appointment was given a new ID
+        """
+        seen = set()
+        renamed = False
+        for apt in self._appointments:
+            if apt.id in seen:
+                apt.id = apt._generate_id()
+                renamed = True
+            seen.add(apt.id)
+        return renamed
+    
+    def _reindex(self):
+        """
+        Sort the appointment list by start time and rebuild the lookup structures
+        Used after bulk loading; single adds/removes keep them up to date directly
+        """
+        self._appointments.sort(key=_by_start)
+        self._starts = [apt.start_ts for apt in self._appointments]
+        self._by_id = {apt.id: apt for apt in self._appointments}
+        self._max_duration = max((apt.end_ts - apt.start_ts for apt in self._appointments),
+                                 default=0)
+    
+    def _insert(self, appointment: Appointment):
+        """Insert an appointment into the list, keeping it sorted by start time"""
+        i = bisect.bisect_right(self._starts, appointment.start_ts)
+        self._starts.insert(i, appointment.start_ts)
+        self._appointments.insert(i, appointment)
+        self._by_id[appointment.id] = appointment
+        duration = appointment.end_ts - appointment.start_ts
+        if duration > self._max_duration:
+            self._max_duration = duration
+    
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Return the SQLite connection, opening it (and creating the table) on first use
+        WAL journaling with synchronous=NORMAL keeps each single-row commit cheap
+        Queries run against the in-memory index, so the table only needs its primary key
+        """
+        if self._db is None:
+            db = sqlite3.connect(self.data_file)
+            try:
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute("PRAGMA synchronous=NORMAL")
+                with db:
+                    db.execute("CREATE TABLE IF NOT EXISTS appt("
+                               "id TEXT PRIMARY KEY, title TEXT, start_ts INTEGER, end_ts INTEGER,"
+                               " description TEXT, location TEXT)")
+            except sqlite3.Error:
+                db.close()
+                raise
+            self._db = db
+        return self._db
+    
+    def close(self):
+        """
+        Release the storage backend; call this before the app exits
+        Writes during the session are only flushed to the OS, so this is where
+        the JSON snapshot and change log are synced to disk
+        """
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+        for f in (self._data_fd, self._log_fd):
+            if f is not None:
+                try:
+                    f.flush()
+                    os.fsync(f.fileno())
+                except OSError as e:
+                    print(f"Error saving appointments: {e}")
+                finally:
+                    f.close()
+        self._data_fd = None
+        self._log_fd = None
+    
+    def _data_handle(self):
+        """Open the snapshot file for rewriting (once per session)"""
+        if self._data_fd is None:
+            # O_CREAT without O_TRUNC: don't clobber the snapshot just by opening it
+            fd = os.open(self.data_file, os.O_RDWR | os.O_CREAT, 0o644)
+            self._data_fd = os.fdopen(fd, 'r+b')
+        return self._data_fd
+    
+    def _log_handle(self):
+        """Open the change log for appending (once per session)"""
+        if self._log_fd is None:
+            self._log_fd = open(self.log_file, 'ab')
+        return self._log_fd
+    
+    def _record_add(self, appointment: Appointment):
+        """Persist a newly added appointment"""
+        if self._use_db:
+            try:
+                with self._connection() as db:
+                    db.execute("INSERT OR REPLACE INTO appt VALUES (?, ?, ?, ?, ?, ?)",
+                               appointment.to_row())
+            except sqlite3.Error as e:
+                print(f"Error saving appointments: {e}")
+        else:
+            self._append_log(appointment.to_dict())
+    
+    def _record_remove(self, appointment: Appointment):
+        """Persist the removal of an appointment"""
+        if self._use_db:
+            try:
+                with self._connection() as db:
+                    db.execute("DELETE FROM appt WHERE id = ?", (appointment.id,))
+            except sqlite3.Error as e:
+                print(f"Error saving appointments: {e}")
+        else:
+            self._append_log({'op': 'del', 'id': appointment.id})
+    
+    def _replay_log(self):
+        """
+        Apply the change log on top of the appointments loaded from the snapshot
+        Replaying is idempotent (adds overwrite by ID, deleting a missing ID is
+        a no-op), so a log left behind by an interrupted compaction is harmless
+        A partial last line from an interrupted write is cut off the file, so
+        the next append starts on a fresh line instead of being glued onto it
+        """
+        by_id = {apt.id: apt for apt in self._appointments}
+        with open(self.log_file, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    # Torn write: only the last line can be missing its newline
+                    print("Discarding incomplete entry at end of change log")
+                    break
+                self._log_size += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    entry = _json_loads(line)
+                    if entry.get('op') == 'del':
+                        by_id.pop(entry['id'], None)
+                    else:
+                        apt = Appointment.from_dict(entry)
+                        by_id[apt.id] = apt
+                except _LOAD_ERRORS as e:
+                    print(f"Skipping bad entry in change log: {e}")
+            torn = f.tell() != self._log_size
+        if torn:
+            with open(self.log_file, 'r+b') as f:
+                f.truncate(self._log_size)
+        self._appointments = list(by_id.values())
+    
+    def _append_log(self, entry: Dict):
+        """
+        Record a single change by appending one line to the change log
+        This is O(1) in the number of appointments, unlike save_appointments
+        """
+        line = _json_dumps(entry, indent=False) + b'\n'
+        try:
+            f = self._log_handle()
+            f.write(line)
+            f.flush()                                 # Hand it to the OS; fsync happens in close()
+            self._log_size += len(line)
+        except Exception as e:                       # Handle any file writing errors
+            print(f"Error saving appointments: {e}")
+            return
+        self._maybe_compact()
+    
+    def _maybe_compact(self):
+        """Fold the change log into the snapshot once the log has grown too large"""
+        if self._load_failed:
+            return                                   # Keep logging; the snapshot is off limits
+        limit = max(self._snapshot_size * self.LOG_COMPACT_RATIO, self.LOG_COMPACT_MIN_BYTES)
+        if self._log_size > limit:
+            self.save_appointments()
     
     def save_appointments(self):
         """
         Save all current appointments to the JSON file
         This preserves appointments between app sessions
-        Called whenever appointments are added or removed
+        Rewrites the whole snapshot and then empties the change log
         """
+        self._ensure_loaded()                        # Never overwrite data we haven't read
+        if self._load_failed:
+            print(f"Not saving: {self.data_file} could not be loaded and would be overwritten")
+            return
+        if self._use_db:
+            # Rows are already written one at a time; this just rewrites them all
+            with self._connection() as db:
+                db.execute("DELETE FROM appt")
+                db.executemany("INSERT INTO appt VALUES (?, ?, ?, ?, ?, ?)",
+                               [apt.to_row() for apt in self._appointments])
+            return
         try:
             # Convert all Appointment objects to dictionaries
-            data = [apt.to_dict() for apt in self.appointments]
-            with open(self.data_file, 'w') as f:     # Open file for writing
-                json.dump(data, f, indent=2)        # Save with nice formatting
+            data = _json_dumps([apt.to_dict() for apt in self._appointments])
+            f = self._data_handle()                  # Reuse the open snapshot file
+            f.seek(0)
+            f.truncate()
+            f.write(data)                           # Save with nice formatting
+            f.flush()
+            self._snapshot_size = len(data)
+            # Everything in the log is now part of the snapshot
+            log = self._log_handle()
+            log.seek(0)
+            log.truncate()
+            self._log_size = 0
         except Exception as e:                       # Handle any file writing errors
             print(f"Error saving appointments: {e}")
     
@@ -256,25 +661,32 @@ class SchedulingApp:
             print("Error: Start time must be before end time")
             return False
         
+        # Existing appointments are needed for the conflict check
+        self._ensure_loaded()
+        
         # Create the new appointment object
         new_appointment = Appointment(title, start_time, end_time, description, location)
         
         # Check if this appointment conflicts with existing ones
-        conflicts = self.find_conflicts(new_appointment)
+        # Fetch one more than we show, to know whether there are others
+        conflicts = list(itertools.islice(self.iter_conflicts(new_appointment),
+                                          self.MAX_CONFLICTS_SHOWN + 1))
         if conflicts:
             # Warn user about conflicts and let them decide
             print(f"\nWarning: This appointment conflicts with:")
-            for conflict in conflicts:
+            for conflict in conflicts[:self.MAX_CONFLICTS_SHOWN]:
                 print(f"  - {conflict}")
+            if len(conflicts) > self.MAX_CONFLICTS_SHOWN:
+                print("  - ... and more")
             
             # Ask user if they want to proceed despite conflicts
             response = input("\nDo you want to add it anyway? (y/n): ").lower()
             if response != 'y':
                 return False  # User cancelled
         
-        # Add appointment to our list and save to file
-        self.appointments.append(new_appointment)
-        self.save_appointments()
+        # Add appointment to our list and record it in storage
+        self._insert(new_appointment)
+        self._record_add(new_appointment)
         print(f"Appointment '{title}' added successfully!")
         return True
     
@@ -288,12 +700,35 @@ class SchedulingApp:
         Returns:
             List of conflicting appointments (empty if no conflicts)
         """
-        conflicts = []
-        # Check the new appointment against each existing appointment
-        for existing in self.appointments:
+        return list(self.iter_conflicts(appointment))
+    
+    def iter_conflicts(self, appointment: Appointment):
+        """
+        Yield existing appointments that overlap with the given appointment
+        Lazy version of find_conflicts: stops as soon as the caller stops asking
+        
+        Args:
+            appointment: The appointment to check for conflicts
+        Yields:
+            Conflicting appointments in start time order
+        """
+        self._ensure_loaded()
+        for existing in self._window(appointment.start_ts, appointment.end_ts):
             if appointment.overlaps_with(existing):
-                conflicts.append(existing)
-        return conflicts
+                yield existing
+    
+    def _window(self, start_ts: int, end_ts: int):
+        """
+        Yield the appointments that could overlap the time range [start_ts, end_ts)
+        Only appointments starting before the range ends can overlap it, and
+        none of those can reach it if they start more than the longest known
+        duration before it starts - so only that window needs checking
+        """
+        appointments = self._appointments
+        lo = bisect.bisect_right(self._starts, start_ts - self._max_duration)
+        hi = bisect.bisect_left(self._starts, end_ts, lo)
+        for i in range(lo, hi):
+            yield appointments[i]
     
     def remove_appointment(self, appointment_id: str) -> bool:
         """
@@ -304,16 +739,39 @@ class SchedulingApp:
         Returns:
             True if appointment was found and removed, False otherwise
         """
-        # Search through all appointments to find the one with matching ID
-        for i, apt in enumerate(self.appointments):
-            if apt.id == appointment_id:
-                removed = self.appointments.pop(i)    # Remove from list
-                self.save_appointments()              # Save changes to file
-                print(f"Removed appointment: {removed.title}")
-                return True
-        # If we get here, no appointment with that ID was found
-        print("Appointment not found")
-        return False
+        self._ensure_loaded()
+        removed = self._by_id.pop(appointment_id, None)
+        if removed is None:
+            print("Appointment not found")
+            return False
+        
+        # Jump to its start time in the sorted list, then find it among any ties
+        i = bisect.bisect_left(self._starts, removed.start_ts)
+        while self._appointments[i] is not removed:
+            i += 1
+        del self._appointments[i]                      # Remove from list
+        del self._starts[i]
+        self._record_remove(removed)                  # Record the removal
+        print(f"Removed appointment: {removed.title}")
+        return True
+    
+    def find_by_prefix(self, prefix: str) -> Optional[str]:
+        """
+        Find the full ID of an appointment from the first few characters of it
+        The schedule displays shortened IDs, so this is what the user types back
+        
+        Args:
+            prefix: Start of an appointment ID
+        Returns:
+            The first matching full ID, or None if nothing matches
+        """
+        if not prefix:
+            return None
+        self._ensure_loaded()
+        for apt_id in self._by_id:
+            if apt_id.startswith(prefix):
+                return apt_id
+        return None
     
     def get_appointments_for_date(self, date: datetime) -> List[Appointment]:
         """
@@ -322,15 +780,17 @@ class SchedulingApp:
         Args:
             date: The date to get appointments for
         Returns:
-            List of appointments on that date
+            List of appointments on that date, sorted by start time
         """
+        self._ensure_loaded()
         # Define the start and end of the requested day
-        start_of_day = date.replace(hour=0, minute=0, second=0, microsecond=0)
-        end_of_day = start_of_day + timedelta(days=1)  # Next day at midnight
+        start_of_day = _to_ts(date.replace(hour=0, minute=0, second=0, microsecond=0))
+        end_of_day = start_of_day + _DAY_SECONDS       # Next day at midnight
         
-        # Find appointments that start within this day
-        return [apt for apt in self.appointments 
-                if start_of_day <= apt.start_time < end_of_day]
+        # Find appointments that start within this day (binary search on start times)
+        lo = bisect.bisect_left(self._starts, start_of_day)
+        hi = bisect.bisect_left(self._starts, end_of_day, lo)
+        return self._appointments[lo:hi]
     
     def get_upcoming_appointments(self, days: int = 7) -> List[Appointment]:
         """
@@ -341,14 +801,15 @@ class SchedulingApp:
         Returns:
             List of upcoming appointments, sorted by start time
         """
+        self._ensure_loaded()
         now = datetime.now()                           # Current date/time
         future_date = now + timedelta(days=days)      # End of time range to check
         
-        # Find appointments between now and the future date
-        upcoming = [apt for apt in self.appointments 
-                   if now <= apt.start_time <= future_date]
-        # Sort by start time so earliest appointments appear first
-        return sorted(upcoming, key=lambda x: x.start_time)
+        # Find appointments between now and the future date (binary search on start times)
+        lo = bisect.bisect_left(self._starts, _to_ts(now))
+        hi = bisect.bisect_right(self._starts, _to_ts(future_date), lo)
+        # self._appointments is kept sorted, so the slice is already in order
+        return self._appointments[lo:hi]
     
     def display_schedule(self, date: datetime = None):
         """
@@ -360,25 +821,25 @@ class SchedulingApp:
         if date is None:
             date = datetime.now()  # Use today if no date specified
         
-        # Get appointments for the requested date
+        # Get appointments for the requested date (already in chronological order)
         appointments = self.get_appointments_for_date(date)
-        # Sort by start time so they appear chronologically
-        appointments.sort(key=lambda x: x.start_time)
         
+        # Collect the output and write it all at once rather than line by line
         # Display header with date and day of week
-        print(f"\n=== Schedule for {date.strftime('%Y-%m-%d (%A)')} ===")
+        lines = [f"\n=== Schedule for {_format_day(date.date())} ==="]
         
         if not appointments:
-            print("No appointments scheduled")  # Show message if no appointments
+            lines.append("No appointments scheduled")  # Show message if no appointments
         else:
             # Display each appointment with its details
             for apt in appointments:
                 # Show ID (first 8 chars), title, time, location
-                print(f"[{apt.id[:8]}] {apt}")
+                lines.append(f"[{apt.id[:8]}] {apt}")
                 # Show description if it exists
                 if apt.description:
-                    print(f"    Description: {apt.description}")
-                print()  # Empty line for spacing
+                    lines.append(f"    Description: {apt.description}")
+                lines.append("")  # Empty line for spacing
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def display_upcoming(self, days: int = 7):
         """
@@ -389,28 +850,90 @@ class SchedulingApp:
         """
         upcoming = self.get_upcoming_appointments(days)
         
-        print(f"\n=== Upcoming Appointments (Next {days} days) ===")
+        # Collect the output and write it all at once rather than line by line
+        lines = [f"\n=== Upcoming Appointments (Next {days} days) ==="]
         
         if not upcoming:
-            print("No upcoming appointments")
+            lines.append("No upcoming appointments")
         else:
             current_date = None  # Track current date to group appointments
             for apt in upcoming:
-                apt_date = apt.start_time.date()
+                apt_date = apt._start_date
                 
                 # If this is a new date, show a date header
                 if apt_date != current_date:
                     current_date = apt_date
-                    print(f"\n--- {apt_date.strftime('%Y-%m-%d (%A)')} ---")
+                    lines.append(f"\n--- {_format_day(apt_date)} ---")
                 
                 # Show appointment with ID for potential removal
-                print(f"[{apt.id[:8]}] {apt}")
+                lines.append(f"[{apt.id[:8]}] {apt}")
                 if apt.description:
-                    print(f"    Description: {apt.description}")
+                    lines.append(f"    Description: {apt.description}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 # ==================== UTILITY FUNCTIONS ====================
 # Helper functions used by the main application
 
+# Non-ISO input formats accepted by parse_datetime, compiled once
+_YMD_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')     # 2025-9-20 (ISO without zero padding)
+_SLASH_DATE_RE = re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})')  # 09/20/2025 or 20/09/2025
+_TIME_RE = re.compile(r'(\d{1,2}):(\d{1,2})')            # 9:30
+
+def _parse_ymd(date_str: str) -> Optional[date]:
+    """
+    Parse a YYYY-MM-DD date (month and day may be a single digit)
+    Returns None if the string isn't in that shape
+    Raises ValueError if it is, but isn't a real date (e.g. 2025-02-30)
+    """
+    # Fast path: exactly YYYY-MM-DD goes to the C parser. The shape check
+    # matters - fromisoformat alone also takes times, week dates and more
+    if len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-':
+        try:
+            return date.fromisoformat(date_str)
+        except ValueError:
+            pass
+    
+    match = _YMD_RE.fullmatch(date_str)
+    if match:
+        year, month, day = match.groups()
+        return date(int(year), int(month), int(day))
+    return None
+
+def _parse_date(date_str: str) -> date:
+    """
+    Parse a date string in any of the supported formats
+    Tries YYYY-MM-DD, then MM/DD/YYYY, then DD/MM/YYYY
+    """
+    date_obj = _parse_ymd(date_str)
+    if date_obj is not None:
+        return date_obj
+    
+    match = _SLASH_DATE_RE.fullmatch(date_str)
+    if match:
+        first, second, year = map(int, match.groups())
+        try:
+            return date(year, first, second)              # MM/DD/YYYY
+        except ValueError:
+            return date(year, second, first)              # DD/MM/YYYY
+    
+    raise ValueError("Invalid date format")
+
+def _parse_time(time_str: str) -> time:
+    """Parse a 24-hour HH:MM time string (the hour may be a single digit)"""
+    # Fast path for exactly HH:MM; fromisoformat alone would also take
+    # seconds, compact forms like 1430 and timezone offsets
+    if len(time_str) == 5 and time_str[2] == ':':
+        try:
+            return time.fromisoformat(time_str)
+        except ValueError:
+            pass
+    
+    match = _TIME_RE.fullmatch(time_str)
+    if not match:
+        raise ValueError("Invalid time format")
+    hour, minute = match.groups()
+    return time(int(hour), int(minute))
+
 def parse_datetime(date_str: str, time_str: str) -> datetime:
     """
     Parse user-entered date and time strings into a datetime object
@@ -426,29 +949,51 @@ def parse_datetime(date_str: str, time_str: str) -> datetime:
     """
     try:
         # Try different date formats to be flexible with user input
-        for date_fmt in ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y']:
-            try:
-                date_obj = datetime.strptime(date_str, date_fmt).date()
-                break  # Found a format that works
-            except ValueError:
-                continue  # Try next format
-        else:
-            # None of the formats worked
-            raise ValueError("Invalid date format")
+        date_obj = _parse_date(date_str)
         
         # Handle time format (currently only supports 24-hour format)
-        time_obj = datetime.strptime(time_str, '%H:%M').time()
+        time_obj = _parse_time(time_str)
         
         # Combine date and time into a single datetime object
         return datetime.combine(date_obj, time_obj)
     except ValueError as e:
         raise ValueError(f"Error parsing date/time: {e}")
 
+def parse_appointment_line(line: str) -> tuple:
+    """
+    Parse a whole appointment entered on one line, separated by '|'
+    Format: title|date|start time|end time|description|location
+    Description and location are optional
+    
+    Args:
+        line: The user's input line
+    Returns:
+        (title, start_time, end_time, description, location)
+    Raises:
+        ValueError if a required field is missing or the date/time is invalid
+    """
+    fields = [field.strip() for field in line.split('|', 5)]
+    if len(fields) < 4:
+        raise ValueError("Expected title|date|start|end[|description|location]")
+    fields += [''] * (6 - len(fields))                # Fill in missing optional fields
+    title, date_str, start_str, end_str, description, location = fields
+    if not title:
+        raise ValueError("Title cannot be empty")
+    start_time = parse_datetime(date_str, start_str)
+    end_time = parse_datetime(date_str, end_str)
+    return title, start_time, end_time, description, location
+
 # ==================== MAIN PROGRAM / USER INTERFACE ====================
 # This is the command-line interface that users interact with
 
-def main():
-    app = SchedulingApp()
+def main(data_file: str = "schedule.json"):
+    """
+    Run the command-line interface
+    Args:
+        data_file: Where appointments are stored; a .db/.sqlite/.sqlite3
+                   name selects SQLite storage instead of JSON
+    """
+    app = SchedulingApp(data_file)
     
     print("=== Personal Scheduling App ===")
     print("Commands: add, remove, today, date, upcoming, quit")
@@ -458,25 +1003,42 @@ def main():
             command = input("\nEnter command: ").lower().strip()
             
             if command == 'quit' or command == 'q':
+                app.close()
                 print("Goodbye!")
                 break
             
             elif command == 'add':
                 print("\n--- Add New Appointment ---")
+                print("(or enter everything at once: title|YYYY-MM-DD|HH:MM|HH:MM|description|location)")
                 title = input("Title: ").strip()
+                
+                # One-line form: all fields in a single input. Titles may contain
+                # '|' themselves, so it needs at least title|date|start|end
+                if title.count('|') >= 3:
+                    try:
+                        title, start_time, end_time, description, location = parse_appointment_line(title)
+                    except ValueError as e:
+                        print(f"Error: {e}")
+                        continue
+                    app.add_appointment(title, start_time, end_time, description, location)
+                    continue
+                
                 if not title:
                     print("Title cannot be empty")
                     continue
                 
-                date_str = input("Date (YYYY-MM-DD): ").strip()
-                start_time_str = input("Start time (HH:MM): ").strip()
-                end_time_str = input("End time (HH:MM): ").strip()
-                
+                # Validate each field as soon as it's entered, so a typo is
+                # reported before the user fills in the rest
                 try:
-                    start_time = parse_datetime(date_str, start_time_str)
-                    end_time = parse_datetime(date_str, end_time_str)
-                except ValueError as e:
-                    print(f"Error: {e}")
+                    date_obj = _parse_date(input("Date (YYYY-MM-DD): ").strip())
+                except ValueError:
+                    print("Error: Invalid date. Use YYYY-MM-DD")
+                    continue
+                try:
+                    start_time = datetime.combine(date_obj, _parse_time(input("Start time (HH:MM): ").strip()))
+                    end_time = datetime.combine(date_obj, _parse_time(input("End time (HH:MM): ").strip()))
+                except ValueError:
+                    print("Error: Invalid time. Use HH:MM")
                     continue
                 
                 description = input("Description (optional): ").strip()
@@ -490,11 +1052,7 @@ def main():
                 apt_id = input("\nEnter appointment ID (first 8 characters): ").strip()
                 
                 # Find full ID from partial ID
-                full_id = None
-                for apt in app.appointments:
-                    if apt.id.startswith(apt_id):
-                        full_id = apt.id
-                        break
+                full_id = app.find_by_prefix(apt_id)
                 
                 if full_id:
                     app.remove_appointment(full_id)
@@ -507,8 +1065,10 @@ def main():
             elif command == 'date':
                 date_str = input("Enter date (YYYY-MM-DD): ").strip()
                 try:
-                    date = datetime.strptime(date_str, '%Y-%m-%d')
-                    app.display_schedule(date)
+                    date_obj = _parse_ymd(date_str)
+                    if date_obj is None:
+                        raise ValueError("Invalid date format")
+                    app.display_schedule(datetime.combine(date_obj, time()))
                 except ValueError:
                     print("Invalid date format. Use YYYY-MM-DD")
             
@@ -534,10 +1094,12 @@ def main():
                 print("Unknown command. Type 'help' for available commands.")
         
         except KeyboardInterrupt:
+            app.close()
             print("\nGoodbye!")
             break
         except Exception as e:
             print(f"An error occurred: {e}")
 
 if __name__ == "__main__":
-    main()
+    # Optional first argument: the schedule file to use
+    main(*sys.argv[1:2])